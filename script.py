@@ -8,6 +8,7 @@
 #   - SSID e password CENTRATI nella colonna destra della tabella.
 #   - QR più grande (145x145 punti).
 #   - Interfaccia CLI elegante con Rich.
+#   - Modalità batch: python script.py --batch credenziali.csv|.json
 #   Struttura:
 #       static/
 #           logo/logo.png (o .ico)   ← un solo file
@@ -15,18 +16,30 @@
 #       output/YYYY-MM-DD_HH-MM-SS/
 # =====================================
 
+# Annotazioni non valutate: i tipi di PIL, numpy, segno e fitz non richiedono l'import
+from __future__ import annotations
+
 import os
 import sys
-import io
+import csv
+import json
+import hashlib
+import shutil
+import multiprocessing as mp
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from typing import TYPE_CHECKING
+
+# PIL, numpy, segno e fitz (PyMuPDF) si importano dentro le funzioni che li
+# usano: servono solo dopo i prompt (l'header legge l'ASCII art dalla cache)
+# e da soli pesano più di metà dell'avvio.
+if TYPE_CHECKING:
+    import fitz
+    import numpy as np
+    import segno
+    from PIL import Image
 
-import qrcode
-from qrcode.image.styledpil import StyledPilImage
-from qrcode.image.styles.moduledrawers import CircleModuleDrawer
-from qrcode.image.styles.colormasks import RadialGradiantColorMask
-from PIL import Image
-
-import fitz  # PyMuPDF
 from dotenv import load_dotenv
 
 from rich.console import Console
@@ -34,6 +47,7 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 from rich.text import Text
+from rich.align import Align
 from rich import box
 from rich.padding import Padding
 
@@ -43,11 +57,21 @@ from prompt_toolkit.shortcuts import prompt
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.application import Application
 from prompt_toolkit.layout import Layout, HSplit, Window
+from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.widgets import RadioList
-from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit.formatted_text import HTML, FormattedText
+from prompt_toolkit.styles import Style as PTStyle
 
 console = Console()
 
+# Directory di lavoro, calcolata una volta: si usa la directory corrente
+# (non __file__) per compatibilità con exe PyInstaller
+BASE_DIR = os.getcwd()
+
+# Versione del formato delle cache su disco (QR, logo, ASCII art): va
+# incrementata a ogni modifica del disegno, così le voci vecchie non si riusano
+_CACHE_VERSION = 3
+
 # Stile questionary per abbinarsi a Rich
 custom_style = Style([
     ('qmark', 'fg:yellow bold'),
@@ -61,40 +85,34 @@ custom_style = Style([
 ])
 
 
-def ask_yes_no(question: str, default: bool = False) -> bool:
-    """
-    Chiede Sì/No con navigazione frecce + shortcut nascosti s/y/n
-    SENZA numeri mostrati
-    """
-    from prompt_toolkit.formatted_text import FormattedText
-    from prompt_toolkit.shortcuts import radiolist_dialog
-    from prompt_toolkit.application import Application
-    from prompt_toolkit.key_binding import KeyBindings
-    from prompt_toolkit.layout.containers import HSplit, Window
-    from prompt_toolkit.layout.controls import FormattedTextControl
-    from prompt_toolkit.layout.layout import Layout
-    from prompt_toolkit.styles import Style as PTStyle
+class _YesNoState:
+    """Stato del prompt Sì/No, letto dall'Application costruita una sola volta."""
+    question = ""
+    selected = 1  # 0=Sì, 1=No
 
-    # Stato della selezione
-    class State:
-        selected = 1 if not default else 0  # 0=Sì, 1=No
 
+@lru_cache(maxsize=None)
+def _yes_no_app() -> Application:
+    """
+    Costruisce (una volta sola) l'Application del prompt Sì/No.
+    Le chiamate successive la riusano cambiando solo domanda e selezione.
+    """
     # Key bindings
     kb = KeyBindings()
 
     @kb.add('up')
     @kb.add('k')
     def move_up(event):
-        State.selected = max(0, State.selected - 1)
+        _YesNoState.selected = max(0, _YesNoState.selected - 1)
 
     @kb.add('down')
     @kb.add('j')
     def move_down(event):
-        State.selected = min(1, State.selected + 1)
+        _YesNoState.selected = min(1, _YesNoState.selected + 1)
 
     @kb.add('enter')
     def accept(event):
-        event.app.exit(result=State.selected == 0)
+        event.app.exit(result=_YesNoState.selected == 0)
 
     # Shortcut nascosti
     @kb.add('s')
@@ -112,16 +130,16 @@ def ask_yes_no(question: str, default: bool = False) -> bool:
 
     def get_text():
         """Genera il testo formattato per il prompt"""
-        lines = [('class:question', f'>> {question}\n')]
+        lines = [('class:question', f'>> {_YesNoState.question}\n')]
 
         # Opzione Sì
-        if State.selected == 0:
+        if _YesNoState.selected == 0:
             lines.append(('class:selected', '  → Sì\n'))
         else:
             lines.append(('', '    Sì\n'))
 
         # Opzione No
-        if State.selected == 1:
+        if _YesNoState.selected == 1:
             lines.append(('class:selected', '  → No\n'))
         else:
             lines.append(('', '    No\n'))
@@ -144,7 +162,7 @@ def ask_yes_no(question: str, default: bool = False) -> bool:
     })
 
     # App
-    app = Application(
+    return Application(
         layout=layout,
         key_bindings=kb,
         style=style,
@@ -152,93 +170,156 @@ def ask_yes_no(question: str, default: bool = False) -> bool:
         mouse_support=False,
     )
 
-    return app.run()
+
+def ask_yes_no(question: str, default: bool = False) -> bool:
+    """
+    Chiede Sì/No con navigazione frecce + shortcut nascosti s/y/n
+    SENZA numeri mostrati
+    """
+    _YesNoState.question = question
+    _YesNoState.selected = 1 if not default else 0
+    return _yes_no_app().run()
 
 
 # ---------------------------
 #  UTIL
 # ---------------------------
 
+# Caratteri ASCII dal più scuro al più chiaro (LUT indicizzata con NumPy)
+ASCII_CHARS = "@#%*+:. "
+
 def get_dominant_color(image_path: str) -> str:
     """Estrae il colore dominante dal logo per usarlo nell'ASCII art."""
+    from PIL import Image
+
     try:
-        img = Image.open(image_path)
-        img = img.convert("RGB")
-        img = img.resize((50, 50))  # Ridimensiona per velocità
-
-        pixels = img.getdata()
-        pixel_count = {}
-
-        for pixel in pixels:
-            # Ignora pixel troppo chiari (bianchi/trasparenti)
-            if sum(pixel) < 700:  # Non bianco
-                pixel_count[pixel] = pixel_count.get(pixel, 0) + 1
-
-        if not pixel_count:
-            return "bright_white"
-
-        # Trova colore più frequente
-        dominant = max(pixel_count, key=pixel_count.get)
-        r, g, b = dominant
-
-        # Converti in colore Rich
-        # Se è blu predominante
-        if b > r and b > g:
-            return "blue"
-        # Se è rosso predominante
-        elif r > g and r > b:
-            return "red"
-        # Se è verde predominante
-        elif g > r and g > b:
-            return "green"
-        # Se è giallo
-        elif r > 150 and g > 150 and b < 100:
-            return "yellow"
-        # Se è scuro
-        elif r < 100 and g < 100 and b < 100:
-            return "bright_black"
-        else:
-            return "white"
+        with Image.open(image_path) as img:
+            return _dominant_color(img)
     except:
         return "white"
 
 
+def _dominant_color(img: Image.Image) -> str:
+    """Colore Rich dominante di un'immagine già aperta."""
+    import numpy as np
+
+    img = img.convert("RGB")
+    img = img.resize((50, 50))  # Ridimensiona per velocità
+
+    arr = np.asarray(img, dtype=np.uint8).reshape(-1, 3)
+    # Ignora pixel troppo chiari (bianchi/trasparenti)
+    arr = arr[arr.sum(axis=1, dtype=np.uint16) < 700]
+
+    if not len(arr):
+        return "bright_white"
+
+    # Trova colore più frequente: RGB impacchettato in un uint32 e contato.
+    # A parità di conteggio vince il colore incontrato per primo.
+    packed = (arr[:, 0].astype(np.uint32) << 16) | (arr[:, 1].astype(np.uint32) << 8) | arr[:, 2]
+    values, first, counts = np.unique(packed, return_index=True, return_counts=True)
+    ties = np.flatnonzero(counts == counts.max())
+    dominant = int(values[ties[np.argmin(first[ties])]])
+    r, g, b = dominant >> 16, (dominant >> 8) & 0xFF, dominant & 0xFF
+
+    # Converti in colore Rich
+    # Se è blu predominante
+    if b > r and b > g:
+        return "blue"
+    # Se è rosso predominante
+    elif r > g and r > b:
+        return "red"
+    # Se è verde predominante
+    elif g > r and g > b:
+        return "green"
+    # Se è giallo
+    elif r > 150 and g > 150 and b < 100:
+        return "yellow"
+    # Se è scuro
+    elif r < 100 and g < 100 and b < 100:
+        return "bright_black"
+    else:
+        return "white"
+
+
 def image_to_ascii(image_path: str, width: int = 25) -> tuple:
     """Converte un'immagine in ASCII art compatta. Ritorna (ascii_art, color)."""
     try:
-        # ASCII characters dal più scuro al più chiaro
-        ASCII_CHARS = ["@", "#", "%", "*", "+", ":", ".", " "]
+        mtime = os.path.getmtime(image_path)
+    except OSError:
+        return None, "white"
+    return _image_to_ascii_cached(image_path, mtime, width)
 
-        img = Image.open(image_path)
 
-        # Ottieni colore dominante
-        color = get_dominant_color(image_path)
+@lru_cache(maxsize=8)
+def _image_to_ascii_cached(image_path: str, mtime: float, width: int) -> tuple:
+    """
+    Memoizza l'ASCII art finché il file non cambia, anche su disco
+    (<cartella>/.cache/<nome>_<mtime>_ascii<width>_v<versione>.txt, colore in prima riga),
+    così all'avvio l'header non decodifica il logo.
+    """
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    cache_path = os.path.join(os.path.dirname(image_path), ".cache",
+                              f"{stem}_{int(mtime)}_ascii{width}_v{_CACHE_VERSION}.txt")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            color, _, ascii_str = f.read().partition("\n")
+        return ascii_str, color
+    except OSError:
+        pass
 
-        # Converti in scala di grigi
-        img = img.convert("L")
+    # PIL solo se la cache non c'è: all'avvio normale non serve importarlo
+    from PIL import Image
 
-        # Ridimensiona mantenendo aspect ratio
-        aspect_ratio = img.height / img.width
-        new_height = int(width * aspect_ratio * 0.45)
-        img = img.resize((width, new_height))
+    try:
+        with Image.open(image_path) as img:
+            ascii_str, color = _render_logo(img, width)
+    except Exception:
+        return None, "white"
 
-        # Converti pixel in ASCII
-        pixels = img.getdata()
-        ascii_str = ""
-        for i, pixel in enumerate(pixels):
-            ascii_str += ASCII_CHARS[min(pixel // 32, len(ASCII_CHARS) - 1)]
-            if (i + 1) % width == 0:
-                ascii_str += "\n"
+    # Scrittura atomica come per i PNG di cache; un errore non è bloccante
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{color}\n{ascii_str}")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return ascii_str, color
 
-        return ascii_str.rstrip(), color
+
+def _render_logo(img: Image.Image, width: int) -> tuple:
+    """
+    ASCII art e colore dominante da un'unica decodifica: il primo convert()
+    carica i pixel, il secondo riusa quelli già in memoria.
+    """
+    import numpy as np
+
+    # Ottieni colore dominante
+    try:
+        color = _dominant_color(img)
     except Exception:
-        return None, "white"
+        color = "white"
+
+    # Converti in scala di grigi
+    img = img.convert("L")
+
+    # Ridimensiona mantenendo aspect ratio
+    aspect_ratio = img.height / img.width
+    new_height = int(width * aspect_ratio * 0.45)
+    img = img.resize((width, new_height))
+
+    # Converti pixel in ASCII: 8 livelli di grigio (>> 5) indicizzano la LUT
+    arr = np.asarray(img, dtype=np.uint8)
+    lut = np.array(list(ASCII_CHARS), dtype="U1")
+    chars = lut[np.minimum(arr >> 5, len(ASCII_CHARS) - 1)]
+    ascii_str = "\n".join("".join(row) for row in chars)
+
+    return ascii_str.rstrip(), color
 
 
 def show_header(logo_path: str = None):
     """Mostra l'header professionale ed elegante con logo compatto."""
-    from rich.align import Align
-
     # Header con logo piccolo ed elegante
     header_parts = []
 
@@ -248,14 +329,13 @@ def show_header(logo_path: str = None):
         if result[0]:
             ascii_logo, logo_color = result
             # Rendi le @ più scure usando bold
+            styles = {'@': f"bold {logo_color}", '#': f"{logo_color}"}
+            dim = f"dim {logo_color}"
             logo_text = Text()
-            for char in ascii_logo:
-                if char == '@':
-                    logo_text.append(char, style=f"bold {logo_color}")
-                elif char == '#':
-                    logo_text.append(char, style=f"{logo_color}")
-                else:
-                    logo_text.append(char, style=f"dim {logo_color}")
+            # Un segmento per sequenza di caratteri con lo stesso stile,
+            # non uno per carattere
+            for style, run in groupby(ascii_logo, key=lambda c: styles.get(c, dim)):
+                logo_text.append("".join(run), style=style)
             header_parts.append(logo_text)
 
     # Titolo in grigio chiaro
@@ -276,62 +356,308 @@ def show_header(logo_path: str = None):
 
 
 def ensure_single_logo(logo_dir: str) -> str:
-    if not os.path.isdir(logo_dir):
-        raise FileNotFoundError(f"Cartella logo non trovata: {logo_dir}")
-    logos = [f for f in os.listdir(logo_dir) if f.lower().endswith((".png", ".ico"))]
-    if len(logos) == 0:
+    try:
+        entries = os.scandir(logo_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        # scandir verifica già la cartella: niente stat separato con isdir
+        raise FileNotFoundError(f"Cartella logo non trovata: {logo_dir}") from None
+    found = None
+    with entries:
+        for entry in entries:
+            # is_file() usa il tipo già letto da scandir (nessuna stat in più
+            # su Windows e sulla maggior parte dei filesystem Linux)
+            if entry.name.lower().endswith((".png", ".ico")) and entry.is_file():
+                if found:
+                    # Basta il secondo logo per fallire, inutile scorrere il resto
+                    raise ValueError(f"Trovati più loghi in {logo_dir}. Lascia un solo file.")
+                found = entry.path
+    if not found:
         raise FileNotFoundError(f"Nessun logo (.png o .ico) in {logo_dir}")
-    if len(logos) > 1:
-        raise ValueError(f"Trovati più loghi in {logo_dir}. Lascia un solo file.")
-    return os.path.join(logo_dir, logos[0])
-
-
-def generate_qr_image(ssid: str, password: str, style: str, logo_path: str) -> Image.Image:
-    """Genera un QR standard o puntinato, con logo al centro, SENZA ombra."""
-    payload = f"WIFI:T:WPA;S:{ssid};P:{password};;"
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_H,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(payload)
-    qr.make(fit=True)
+    return found
+
+
+@lru_cache(maxsize=4)
+def _circle_stamp(box_size: int) -> np.ndarray:
+    """
+    Modulo circolare antialiasato (0 = scuro, 255 = sfondo), disegnato come
+    qrcode CircleModuleDrawer: ellisse a 4x la dimensione, poi LANCZOS.
+    """
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    fake_size = box_size * 4
+    circle = Image.new("L", (fake_size, fake_size), 255)
+    ImageDraw.Draw(circle).ellipse((0, 0, fake_size, fake_size), fill=0)
+    return np.asarray(circle.resize((box_size, box_size), Image.Resampling.LANCZOS))
+
+
+def _render_circles(matrix, box_size: int, border: int = 4,
+                    center_color=(0, 0, 0), edge_color=(40, 40, 40)) -> Image.Image:
+    """
+    QR a moduli circolari con gradiente radiale su sfondo bianco, in NumPy.
+    Stesso risultato di qrcode StyledPilImage + CircleModuleDrawer +
+    RadialGradiantColorMask: i tre occhi restano quadrati pieni, ogni altro
+    modulo scuro riceve lo stesso timbro circolare.
+    """
+    import numpy as np
+    from PIL import Image
+
+    dark = np.array(matrix, dtype=bool)
+    n = dark.shape[0]
+    r, c = np.ogrid[0:n, 0:n]
+    eye = ((r < 7) & (c < 7)) | ((r < 7) & (n - c < 8)) | ((n - r < 8) & (c < 7))
+
+    # Celle (riga, y, colonna, x): timbro sui moduli dati, 0 sugli occhi, 255 altrove
+    stamp = _circle_stamp(box_size)
+    cells = np.where((dark & ~eye)[:, None, :, None], stamp[None, :, None, :], np.uint8(255))
+    cells = np.where((dark & eye)[:, None, :, None], np.uint8(0), cells)
+    gray = np.pad(cells.reshape(n * box_size, n * box_size), border * box_size,
+                  constant_values=255)
+
+    # Gradiente: colore di disegno in ogni pixel secondo la distanza dal centro,
+    # miscelato col bianco in proporzione al grigio (conserva l'antialiasing)
+    size = gray.shape[0]
+    back = np.full(3, 255.0)
+    norm = ((255.0 - gray) / 255.0)[..., None]
+    ys, xs = np.mgrid[0:size, 0:size]
+    dist = (np.hypot(xs - size / 2, ys - size / 2) / (np.sqrt(2) * size / 2))[..., None]
+    fg = np.trunc(np.array(edge_color) * dist + np.array(center_color) * (1 - dist))
+    return Image.fromarray((fg * norm + back * (1 - norm)).astype(np.uint8))
+
+
+def _qr_cache_dir() -> str:
+    """Cartella della cache QR. Contiene le password WiFi codificate nei PNG."""
+    return os.path.join(BASE_DIR, "output", ".cache")
+
+
+def clear_qr_cache():
+    """Elimina la cache dei QR (output/.cache), che contiene le credenziali."""
+    shutil.rmtree(_qr_cache_dir(), ignore_errors=True)
+
+
+def _save_cache_png(img: Image.Image, path: str, compress_level: int = 3):
+    """Scrive un PNG di cache in modo atomico. Un errore di scrittura non è bloccante."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        img.save(tmp_path, "PNG", compress_level=compress_level)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=8)
+def _load_logo(logo_path: str, logo_mtime: float, logo_size: int) -> Image.Image:
+    """
+    Apre il logo e lo ridimensiona a logo_size; memoizzato finché il file non cambia.
+    Il logo ridimensionato è salvato anche in logo/.cache/ per le esecuzioni successive.
+    """
+    from PIL import Image
+
+    stem = os.path.splitext(os.path.basename(logo_path))[0]
+    cache_path = os.path.join(os.path.dirname(logo_path), ".cache",
+                              f"{stem}_{int(logo_mtime)}_{logo_size}_v{_CACHE_VERSION}.png")
+    if os.path.exists(cache_path):
+        with Image.open(cache_path) as cached:
+            return cached.convert("RGBA")
+
+    with Image.open(logo_path) as src:
+        # Per i JPEG decodifica già ridotta; no-op per PNG e ICO
+        src.draft("RGB", (logo_size, logo_size))
+        # Le immagini a palette o 1 bit si ridimensionerebbero in NEAREST:
+        # solo queste si convertono prima, le altre dopo (meno pixel da toccare)
+        if src.mode not in ("RGB", "RGBA", "L", "LA"):
+            src = src.convert("RGBA")
+        # Un solo resize alla misura finale, rispettando le proporzioni e
+        # senza ingrandire (come thumbnail)
+        scale = min(logo_size / src.width, logo_size / src.height, 1)
+        target = (max(1, round(src.width * scale)), max(1, round(src.height * scale)))
+        logo = src.resize(target, Image.Resampling.LANCZOS).convert("RGBA")
+    _save_cache_png(logo, cache_path)
+    return logo
+
+
+def generate_qr_image(ssid: str, password: str, style: str, logo_path: str,
+                      box_size: int = 10, error: str = None) -> Image.Image:
+    """
+    Genera un QR standard o puntinato, con logo al centro, SENZA ombra.
+    box_size è il lato in pixel di ogni modulo del QR.
+    error è il livello minimo di correzione ("l", "m", "q", "h"). Di default
+    Q (25%) per lo standard, che basta per il logo (circa il 4% dell'area),
+    e H per l'artistico, dove i moduli a cerchio si leggono peggio; segno
+    lo alza comunque ad H se ci sta nella stessa versione.
+    """
+    if error is None:
+        error = _default_error(style)
+    logo_mtime = os.path.getmtime(logo_path)
+    payload = _wifi_payload(ssid, password)
+    # Copia: il chiamante può modificare l'immagine senza sporcare la cache
+    return _build_qr_cached(payload, style, logo_path, logo_mtime, box_size, error).copy()
+
+
+def _default_error(style: str) -> str:
+    """Livello di correzione di default: H per l'artistico, Q per lo standard."""
+    return "h" if style == "artistico" else "q"
+
+
+# Caratteri riservati nei campi del payload WIFI:, da precedere con "\"
+_WIFI_ESCAPE = str.maketrans({c: "\\" + c for c in '\\;,:"'})
+
+
+def _wifi_payload(ssid: str, password: str) -> str:
+    """Payload WIFI: con SSID e password escapati (un solo translate per campo)."""
+    return f"WIFI:T:WPA;S:{ssid.translate(_WIFI_ESCAPE)};P:{password.translate(_WIFI_ESCAPE)};;"
+
+
+@lru_cache(maxsize=128)
+def _build_qr_cached(payload: str, style: str, logo_path: str, logo_mtime: float,
+                     box_size: int, error: str) -> Image.Image:
+    """
+    Memoizza il QR finito in memoria e su disco (output/.cache/<hash>.png),
+    così le esecuzioni successive con gli stessi dati leggono solo un PNG.
+    I PNG codificano SSID e password: clear_qr_cache() li elimina.
+    """
+    from PIL import Image
+
+    key = hashlib.blake2b(
+        f"{_CACHE_VERSION}|{payload}|{style}|{logo_path}|{logo_mtime}|{box_size}|{error}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    cache_path = os.path.join(_qr_cache_dir(), f"{key}.png")
+    if os.path.exists(cache_path):
+        with Image.open(cache_path) as cached:
+            return cached.convert("RGB")
+
+    qr_img = _render_qr_image(payload, style, logo_path, logo_mtime, box_size, error)
+    _save_cache_png(qr_img, cache_path)
+    return qr_img
+
+
+@lru_cache(maxsize=32)
+def _encode_qr(payload: str, error: str = "q") -> segno.QRCode:
+    """
+    Codifica il payload con segno; memoizzato per (payload, error).
+    boost_error (default di segno) alza la correzione fin dove non serve
+    una versione più grande.
+    """
+    import segno
+
+    # Il payload contiene sempre ";", quindi è comunque in modalità byte:
+    # dichiararlo evita l'analisi dei caratteri. Byte sempre in UTF-8, come
+    # scriveva qrcode: di suo segno proverebbe prima ISO-8859-1 e Shift_JIS,
+    # che i lettori non riconoscono senza ECI (greco e cirillico illeggibili)
+    return segno.make_qr(payload, error=error, mode="byte", encoding="utf-8")
+
+
+def _render_qr_image(payload: str, style: str, logo_path: str, logo_mtime: float,
+                     box_size: int, error: str) -> Image.Image:
+    import numpy as np
+    from PIL import Image
 
     if style == "artistico":
-        qr_img = qr.make_image(
-            image_factory=StyledPilImage,
-            module_drawer=CircleModuleDrawer(),
-            color_mask=RadialGradiantColorMask(
-                back_color=(255, 255, 255),
-                center_color=(0, 0, 0),
-                edge_color=(40, 40, 40),
-            ),
-        ).convert("RGBA")
+        qr_img = _render_circles(_encode_qr(payload, error).matrix, box_size)
     else:
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGBA")
+        # Matrice dei moduli da segno (1 = scuro) con 4 moduli di bordo,
+        # espansa a box_size pixel per modulo con np.kron: niente PNG intermedio
+        modules = np.pad(np.array(_encode_qr(payload, error).matrix, dtype=np.uint8), 4)
+        pixels = np.kron(modules, np.ones((box_size, box_size), dtype=np.uint8))
+        qr_img = Image.fromarray((1 - pixels) * 255).convert("RGB")
 
     # Applica logo al centro (max 20% del lato)
-    logo = Image.open(logo_path).convert("RGBA")
     w, h = qr_img.size
     logo_max = int(min(w, h) * 0.20)
-    logo.thumbnail((logo_max, logo_max))
+    logo = _load_logo(logo_path, logo_mtime, logo_max)
     lx = (w - logo.width) // 2
     ly = (h - logo.height) // 2
-    qr_img.paste(logo, (lx, ly), logo)
-    return qr_img
+
+    # Composizione alpha vettorizzata, solo sul riquadro del logo. Il QR resta
+    # RGB senza canale alpha (è opaco): un byte in meno per pixel da comprimere.
+    qr_arr = np.array(qr_img)
+    logo_arr = np.asarray(logo)
+    roi = qr_arr[ly:ly + logo.height, lx:lx + logo.width]
+    alpha = logo_arr[..., 3:4].astype(np.uint16)
+    roi[...] = (logo_arr[..., :3] * alpha + roi * (255 - alpha)) // 255
+    return Image.fromarray(qr_arr)
 
 
 # ---------------------------
 #  PDF FILLING (ancore testuali)
 # ---------------------------
 
-def _find_anchor_bbox(page: fitz.Page, text: str):
-    """Trova il rettangolo della prima occorrenza di 'text' (case-sensitive)."""
-    hits = page.search_for(text)
+# Colonna destra della tabella nel template (analizzata dal template), in punti
+_TABLE_L, _TABLE_R = 293.04, 510.24
+_TABLE_CENTER = (_TABLE_L + _TABLE_R) / 2  # 401.64
+_WHITE = (1, 1, 1)
+# Font dei valori: _helv12_text_length è tarata su questi due
+_FONT = "helv"
+_FONTSIZE = 12
+# Lato del QR in punti (il QR originale del template è circa 128x128)
+_QR_SIDE = 145
+
+@lru_cache(maxsize=None)
+def _helv12_ascii_widths() -> np.ndarray:
+    """
+    Larghezze dei caratteri ASCII stampabili in Helvetica 12pt, misurate una volta.
+    Per questi caratteri la larghezza di una stringa è la somma delle larghezze.
+    """
+    import numpy as np
+    import fitz
+
+    return np.array([
+        fitz.get_text_length(chr(i), fontname="helv", fontsize=12) if 32 <= i < 127 else 0.0
+        for i in range(128)
+    ])
+
+
+def _helv12_text_length(text: str) -> float:
+    """Equivale a fitz.get_text_length(text, "helv", 12), con tabella per l'ASCII."""
+    import numpy as np
+
+    if text.isascii() and text.isprintable():
+        return float(_helv12_ascii_widths()[np.frombuffer(text.encode("ascii"), dtype=np.uint8)].sum())
+    # Fuori dall'ASCII MuPDF usa glifi di ripiego non additivi: misura diretta
+    import fitz
+
+    return fitz.get_text_length(text, fontname="helv", fontsize=12)
+
+
+def _find_anchor_bbox(page: fitz.Page, text: str, textpage: fitz.TextPage = None):
+    """
+    Trova il rettangolo della prima occorrenza di 'text' (case-sensitive).
+    Passando una TextPage già estratta si evita di ricostruirla a ogni ricerca.
+    """
+    hits = page.search_for(text, textpage=textpage)
     return hits[0] if hits else None
 
 
+@lru_cache(maxsize=4)
+def _load_template_bytes(template_path: str, mtime: float) -> bytes:
+    """Legge il template una sola volta per versione del file."""
+    with open(template_path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4)
+def _template_anchors(template_path: str, mtime: float) -> dict:
+    """
+    Cerca ancore e valori esistenti una sola volta per versione del template.
+    I Rect restituiti sono condivisi: vanno solo letti, mai modificati.
+    """
+    import fitz
+
+    with fitz.open(stream=_load_template_bytes(template_path, mtime), filetype="pdf") as doc:
+        page = doc[0]
+        # Estrazione del testo una volta sola, condivisa dalle cinque ricerche
+        textpage = page.get_textpage()
+        return {
+            "ssid": _find_anchor_bbox(page, "Nome della rete", textpage),
+            "pwd": _find_anchor_bbox(page, "Password", textpage),
+            "qr": _find_anchor_bbox(page, "INQUADRARE IL QR CODE", textpage),
+            "ssid_val": _find_anchor_bbox(page, "ZNR Ospiti", textpage),
+            "pwd_val": _find_anchor_bbox(page, "Edoras-2346", textpage),
+        }
+
+
 def fill_pdf(template_path: str, out_pdf_path: str, ssid: str, password: str, qr_img: Image.Image):
     """
     Compila il template:
@@ -340,26 +666,32 @@ def fill_pdf(template_path: str, out_pdf_path: str, ssid: str, password: str, qr
       - copre l'area QR dedicata e inserisce il nuovo QR
     Non modifica nient'altro.
     """
-    doc = fitz.open(template_path)
-    page = doc[0]
+    import numpy as np
+    import fitz  # PyMuPDF
+
+    mtime = os.path.getmtime(template_path)
+    anchors = _template_anchors(template_path, mtime)
 
     # --- Ancore testuali ---
-    anchor_ssid = _find_anchor_bbox(page, "Nome della rete")
-    anchor_pwd  = _find_anchor_bbox(page, "Password")
-    anchor_qr   = _find_anchor_bbox(page, "INQUADRARE IL QR CODE")
+    anchor_ssid = anchors["ssid"]
+    anchor_pwd  = anchors["pwd"]
+    anchor_qr   = anchors["qr"]
 
     if not (anchor_ssid and anchor_pwd and anchor_qr):
-        doc.close()
         missing = []
         if not anchor_ssid: missing.append("Nome della rete")
         if not anchor_pwd:  missing.append("Password")
         if not anchor_qr:   missing.append("INQUADRARE IL QR CODE")
         raise RuntimeError(f"Ancora(e) non trovata(e) nel template: {', '.join(missing)}")
 
+    # Apertura dai byte in memoria: niente rilettura del file a ogni chiamata
+    doc = fitz.open(stream=_load_template_bytes(template_path, mtime), filetype="pdf")
+    page = doc[0]
+
     # --- Trova le posizioni REALI dei valori da sostituire ---
     # Cerchiamo direttamente i valori esistenti nel template per sovrascriverli
-    anchor_ssid_value = _find_anchor_bbox(page, "ZNR Ospiti")
-    anchor_pwd_value  = _find_anchor_bbox(page, "Edoras-2346")
+    anchor_ssid_value = anchors["ssid_val"]
+    anchor_pwd_value  = anchors["pwd_val"]
 
     # Se non troviamo i valori, usiamo posizioni relative alle etichette
     if anchor_ssid_value:
@@ -376,88 +708,193 @@ def fill_pdf(template_path: str, out_pdf_path: str, ssid: str, password: str, qr
         pwd_x  = anchor_pwd.x1 + 100
         pwd_y  = anchor_pwd.y0 + 14
 
-    # Area QR: cerchiamo il QR esistente o usiamo posizione sotto l'ancora
-    # Il QR nel template è a circa 128x128 punti, lo ingrandiamo un po'
-    qr_side = 145  # lato QR in punti (più grande di prima)
-    # Centra il QR sotto l'ancora
+    # Area QR: centrata sotto l'ancora
     anchor_center_x = (anchor_qr.x0 + anchor_qr.x1) / 2
-    qr_x = anchor_center_x - (qr_side / 2)
+    qr_x = anchor_center_x - (_QR_SIDE / 2)
     qr_y = anchor_qr.y1 + 15  # sotto l'ancora, con margine ridotto per compensare dimensione maggiore
 
-    # --- Prepara stream immagine QR ---
-    qr_buf = io.BytesIO()
-    # salviamo come PNG, PyMuPDF lo embedda bene
-    qr_img.save(qr_buf, format="PNG")
-    qr_buf.seek(0)
-    pix = fitz.Pixmap(qr_buf)
-
-    # --- Rimuovi i valori esistenti usando redact (rimozione permanente) ---
-    white = (1, 1, 1)
-
-    # Coordinate della colonna destra della tabella (per pulire tutta la cella)
-    table_col_right_left = 293.04
-    table_col_right_right = 510.24
-
+    # --- Prepara pixmap QR dai pixel grezzi (nessun passaggio PNG) ---
+    if qr_img.mode not in ("RGB", "RGBA"):
+        qr_img = qr_img.convert("RGB")
+    # L'eventuale alpha si scarta dalla vista NumPy, senza convert() di PIL
+    rgb = np.asarray(qr_img)[..., :3]
+    pix = fitz.Pixmap(fitz.csRGB, qr_img.width, qr_img.height, rgb.tobytes(), 0)
+
+    # --- Copri i valori esistenti con rettangoli bianchi ---
+    # I valori del template sono segnaposto: basta coprirli. draw_rect accoda
+    # poche istruzioni al content stream, apply_redactions lo riscriveva tutto.
+    cover_rects = []
     if anchor_ssid_value:
-        # Redact (rimuovi) tutta la cella SSID (non solo il vecchio valore)
-        page.add_redact_annot(fitz.Rect(table_col_right_left + 5, anchor_ssid_value.y0 - 2,
-                                        table_col_right_right - 5, anchor_ssid_value.y1 + 2),
-                              fill=white)
+        # Copri tutta la cella SSID (non solo il vecchio valore)
+        cover_rects.append(fitz.Rect(_TABLE_L + 5, anchor_ssid_value.y0 - 2,
+                                     _TABLE_R - 5, anchor_ssid_value.y1 + 2))
+    else:
+        # Valore non trovato nel template: copri l'area generica
+        cover_rects.append(fitz.Rect(ssid_x - 2, ssid_y - 14, ssid_x + 200, ssid_y + 4))
 
     if anchor_pwd_value:
-        # Redact (rimuovi) tutta la cella Password
-        page.add_redact_annot(fitz.Rect(table_col_right_left + 5, anchor_pwd_value.y0 - 2,
-                                        table_col_right_right - 5, anchor_pwd_value.y1 + 2),
-                              fill=white)
-
-    # Cerca e rimuovi il QR esistente (tutte le immagini nella zona del QR)
-    page.add_redact_annot(fitz.Rect(qr_x - 5, qr_y - 5, qr_x + qr_side + 5, qr_y + qr_side + 5),
-                          fill=white)
-
-    # Applica tutte le redaction
-    page.apply_redactions()
-
-    # Se non abbiamo trovato i valori nel template, copri le aree generiche
-    if not anchor_ssid_value or not anchor_pwd_value:
-        shape = page.new_shape()
-        if not anchor_ssid_value:
-            shape.draw_rect(fitz.Rect(ssid_x - 2, ssid_y - 14, ssid_x + 200, ssid_y + 4))
-            shape.finish(fill=white, color=white)
-        if not anchor_pwd_value:
-            shape.draw_rect(fitz.Rect(pwd_x - 2, pwd_y - 14, pwd_x + 200, pwd_y + 4))
-            shape.finish(fill=white, color=white)
-        shape.commit()
-
-    # --- Testi centrati nella tabella (font: usa font di default del PDF; dimensione 12) ---
-    fontname = "helv"
-    fontsize = 12
-
-    # Coordinate fisse della tabella (analizzate dal template)
-    # La colonna destra va da x=293.04 a x=510.24
-    table_col_right_left = 293.04
-    table_col_right_right = 510.24
-    table_col_right_center = (table_col_right_left + table_col_right_right) / 2  # 401.64
+        # Copri tutta la cella Password
+        cover_rects.append(fitz.Rect(_TABLE_L + 5, anchor_pwd_value.y0 - 2,
+                                     _TABLE_R - 5, anchor_pwd_value.y1 + 2))
+    else:
+        cover_rects.append(fitz.Rect(pwd_x - 2, pwd_y - 14, pwd_x + 200, pwd_y + 4))
 
+    # Copri il QR esistente
+    cover_rects.append(fitz.Rect(qr_x - 5, qr_y - 5, qr_x + _QR_SIDE + 5, qr_y + _QR_SIDE + 5))
+
+    # Un solo passaggio per tutte le coperture, senza Shape separato
+    for rect in cover_rects:
+        page.draw_rect(rect, color=_WHITE, fill=_WHITE, width=0, overlay=True)
+
+    # --- Testi centrati nella colonna destra della tabella ---
     # Calcola larghezza effettiva del testo per centrarlo
-    # Usa PyMuPDF per misurare la larghezza esatta
-    ssid_width = fitz.get_text_length(ssid, fontname=fontname, fontsize=fontsize)
-    pwd_width = fitz.get_text_length(password, fontname=fontname, fontsize=fontsize)
+    # (tabella precalcolata per helv 12pt, vedi _helv12_text_length)
+    ssid_width = _helv12_text_length(ssid)
+    pwd_width = _helv12_text_length(password)
 
     # Posiziona il testo centrato nella cella
-    ssid_x = table_col_right_center - (ssid_width / 2)
-    pwd_x = table_col_right_center - (pwd_width / 2)
+    ssid_x = _TABLE_CENTER - (ssid_width / 2)
+    pwd_x = _TABLE_CENTER - (pwd_width / 2)
 
-    page.insert_text((ssid_x, ssid_y), ssid, fontname=fontname, fontsize=fontsize, fill=(0, 0, 0))
-    page.insert_text((pwd_x,  pwd_y),  password, fontname=fontname, fontsize=fontsize, fill=(0, 0, 0))
+    page.insert_text((ssid_x, ssid_y), ssid, fontname=_FONT, fontsize=_FONTSIZE, fill=(0, 0, 0))
+    page.insert_text((pwd_x,  pwd_y),  password, fontname=_FONT, fontsize=_FONTSIZE, fill=(0, 0, 0))
 
     # --- Inserisci immagine QR nella box pulita ---
-    page.insert_image(fitz.Rect(qr_x, qr_y, qr_x + qr_side, qr_y + qr_side), stream=qr_buf.getvalue())
-
-    # Salva
-    doc.save(out_pdf_path)
+    page.insert_image(fitz.Rect(qr_x, qr_y, qr_x + _QR_SIDE, qr_y + _QR_SIDE), pixmap=pix)
+
+    # Salvataggio leggero: senza garbage/clean MuPDF non rianalizza tutti gli
+    # oggetti né riscrive i content stream. insert_image salva i campioni del
+    # pixmap non compressi: è deflate=True a comprimerli (circa 40 KB invece di
+    # 600), quindi non va tolto, mentre deflate_images non serve.
+    # Per un PDF da distribuire, garbage=1 toglie gli oggetti orfani a costo minimo.
+    doc.save(out_pdf_path, deflate=True, deflate_images=False, garbage=0, clean=False)
     doc.close()
 
 
+# ---------------------------
+#  BATCH
+# ---------------------------
+
+def _safe_filename(text: str) -> str:
+    """Riduce un SSID a caratteri sicuri per un nome file."""
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in text)
+
+
+def _batch_worker(job: tuple) -> tuple:
+    """
+    Genera e salva un singolo QR del batch (eseguito in un processo del pool)
+    e, se c'è un template, il PDF compilato. Ritorna (png, pdf o None, errore o None):
+    un PDF non riuscito non interrompe il batch e il PNG resta salvato.
+    Il template si legge una volta per processo (_load_template_bytes è memoizzata).
+    Ogni credenziale si genera una sola volta: si rende direttamente, senza
+    le cache di _build_qr_cached (né PNG in output/.cache né memoria lru).
+    """
+    index, (ssid, password, style), logo_path, out_dir, template_path = job
+    name = f"{index:03d}_{_safe_filename(ssid)}"
+    qr_img = _render_qr_image(_wifi_payload(ssid, password), style, logo_path,
+                              os.path.getmtime(logo_path), 10, _default_error(style))
+    qr_png_path = os.path.join(out_dir, f"wifi_qr_{name}.png")
+    qr_img.save(qr_png_path, "PNG", optimize=False, compress_level=3)
+
+    out_pdf = error = None
+    if template_path:
+        out_pdf = os.path.join(out_dir, f"wifi_compilato_{name}.pdf")
+        try:
+            fill_pdf(template_path, out_pdf, ssid, password, qr_img)
+        except Exception as e:
+            # Come messaggio: l'eccezione potrebbe non passare tra processi
+            out_pdf, error = None, str(e)
+    return qr_png_path, out_pdf, error
+
+
+def _make_output_dir() -> str:
+    """Crea output/YYYY-MM-DD_HH-MM-SS e ne ritorna il percorso."""
+    out_dir = os.path.join(BASE_DIR, "output", datetime.now().strftime("%Y-%m-%d_%H-%M-%S"))
+    os.makedirs(out_dir, exist_ok=True)
+    return out_dir
+
+
+def generate_wifi_qrs(creds: list, out_dir: str = None, template_path: str = None) -> list:
+    """
+    Genera in parallelo un QR per ogni credenziale (ssid, password, stile).
+    I job sono indipendenti e CPU-bound: un processo per core.
+    Senza out_dir, tutto il batch finisce in un'unica cartella con timestamp,
+    creata qui una sola volta (i worker non toccano il filesystem per questo).
+    Con template_path, ogni worker compila anche il PDF della sua credenziale.
+    Ritorna i percorsi dei PNG salvati.
+    """
+    from PIL import Image
+
+    logo_path = ensure_single_logo(os.path.join(BASE_DIR, "static", "logo"))
+    if out_dir is None:
+        out_dir = _make_output_dir()
+    else:
+        os.makedirs(out_dir, exist_ok=True)
+
+    jobs = [(i, cred, logo_path, out_dir, template_path) for i, cred in enumerate(creds, 1)]
+    paths = []
+    # Image.preinit registra subito i plugin PIL in ogni worker
+    with mp.Pool(initializer=Image.preinit) as pool:
+        for path, pdf_path, error in pool.imap_unordered(_batch_worker, jobs, chunksize=4):
+            console.print(f"[green bold][OK][/green bold] QR Code generato: [white]{path}[/white]")
+            if pdf_path:
+                console.print(f"[green bold][OK][/green bold] PDF compilato: [white]{pdf_path}[/white]")
+            elif error:
+                console.print(f"[red bold][ERRORE][/red bold] Compilazione PDF ({os.path.basename(path)}): {error}")
+            paths.append(path)
+    return paths
+
+
+def _cred_field(row: dict, key: str) -> str:
+    """Campo di una credenziale come stringa: nel JSON può essere un numero."""
+    value = row.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def load_credentials(path: str) -> list:
+    """
+    Legge le credenziali per il batch da CSV (intestazione ssid,password[,style],
+    separati da "," o ";")
+    o da JSON (lista di oggetti con le stesse chiavi).
+    Ritorna una lista di (ssid, password, stile); lo stile di default è "standard".
+    """
+    # utf-8-sig: i CSV salvati da Excel iniziano col BOM, che finirebbe nel
+    # nome della prima colonna ("\ufeffssid")
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith(".json"):
+            rows = json.load(f)
+        else:
+            # Excel con le impostazioni italiane separa i campi con ";"
+            sample = f.read(4096)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=",;")
+            except csv.Error:
+                dialect = csv.excel
+            reader = csv.DictReader(f, dialect=dialect)
+            header = reader.fieldnames or []
+            if "ssid" not in header or "password" not in header:
+                raise ValueError(f"Intestazione CSV senza colonne ssid e password: {header} "
+                                 "(atteso ssid,password[,style], separati da , o ;)")
+            rows = list(reader)
+    if not isinstance(rows, list):
+        raise ValueError("Il JSON deve essere una lista di oggetti")
+
+    creds = []
+    for n, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise ValueError(f"Riga {n}: atteso un oggetto con ssid e password")
+        ssid = _cred_field(row, "ssid")
+        password = _cred_field(row, "password")
+        style = (_cred_field(row, "style") or "standard").lower()
+        if not ssid or not password:
+            raise ValueError(f"Riga {n}: ssid e password sono obbligatori")
+        if style not in ("standard", "artistico"):
+            raise ValueError(f"Riga {n}: stile non valido '{style}' (standard o artistico)")
+        creds.append((ssid, password, style))
+    return creds
+
+
 # ---------------------------
 #  MAIN
 # ---------------------------
@@ -473,15 +910,33 @@ def clean_env_vars():
 
 
 if __name__ == "__main__":
-    console.clear()
-    load_dotenv()
+    # Necessario per il pool di processi nell'eseguibile PyInstaller (Windows)
+    mp.freeze_support()
 
-    # Setup percorsi - usa directory corrente per compatibilità con exe PyInstaller
-    base_dir = os.getcwd()
-    static_dir = os.path.join(base_dir, "static")
+    # Setup percorsi (BASE_DIR è la directory corrente)
+    static_dir = os.path.join(BASE_DIR, "static")
     logo_dir = os.path.join(static_dir, "logo")
     template_pdf = os.path.join(static_dir, "template.pdf")
 
+    # Modalità batch: python script.py --batch credenziali.csv|.json
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        if len(sys.argv) != 3:
+            console.print("[red bold][ERRORE][/red bold] Uso: python script.py --batch credenziali.csv|.json")
+            sys.exit(1)
+        try:
+            creds = load_credentials(sys.argv[2])
+            template = template_pdf if os.path.exists(template_pdf) else None
+            out_dir = _make_output_dir()
+            generate_wifi_qrs(creds, out_dir, template)
+        except Exception as e:
+            console.print(f"[red bold][ERRORE][/red bold] Batch: {e}")
+            sys.exit(1)
+        console.print(f"\n[green bold]>> COMPLETATO <<[/green bold] {len(creds)} QR in [white]{out_dir}[/white]\n")
+        sys.exit(0)
+
+    console.clear()
+    load_dotenv()
+
     # Carica logo
     try:
         logo_path = ensure_single_logo(logo_dir)
@@ -532,7 +987,7 @@ if __name__ == "__main__":
                 questionary.Choice("QR Artistico - QR code con moduli circolari e gradiente", value="artistico"),
                 questionary.Separator(),
                 questionary.Choice("Esci", value="exit"),
-                questionary.Choice("Esci e pulisci variabili env", value="exit_clean"),
+                questionary.Choice("Esci e pulisci variabili env e cache QR", value="exit_clean"),
             ],
             style=custom_style,
             qmark=">>",
@@ -547,7 +1002,8 @@ if __name__ == "__main__":
         # Gestione uscita con pulizia env
         if choice == "exit_clean":
             clean_env_vars()
-            console.print("\n[yellow]Variabili env pulite. Arrivederci![/yellow]\n")
+            clear_qr_cache()
+            console.print("\n[yellow]Variabili env e cache QR pulite. Arrivederci![/yellow]\n")
             sys.exit(0)
 
         # Determina stile QR
@@ -555,17 +1011,14 @@ if __name__ == "__main__":
         style_name = "Standard" if choice == "standard" else "Artistico"
 
         # Output directory
-        out_root = os.path.join(base_dir, "output")
-        ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        out_dir = os.path.join(out_root, ts)
-        os.makedirs(out_dir, exist_ok=True)
+        out_dir = _make_output_dir()
 
         # Genera QR
         console.print()
         with console.status(f"[bold white]>> Generazione QR code {style}...[/bold white]", spinner="dots"):
             qr_img = generate_qr_image(ssid, password, style, logo_path)
             qr_png_path = os.path.join(out_dir, "wifi_qr.png")
-            qr_img.convert("RGB").save(qr_png_path, "PNG")
+            qr_img.save(qr_png_path, "PNG", optimize=False, compress_level=3)
 
         console.print(f"[green bold][OK][/green bold] QR Code generato: [white]{qr_png_path}[/white]\n")
 
@@ -580,13 +1033,12 @@ if __name__ == "__main__":
 
                 with console.status("[bold white]>> Compilazione PDF...[/bold white]", spinner="dots"):
                     try:
-                        fill_pdf(template_pdf, out_pdf, ssid, password, qr_img.convert("RGB"))
+                        fill_pdf(template_pdf, out_pdf, ssid, password, qr_img)
                         console.print(f"[green bold][OK][/green bold] PDF compilato: [white]{out_pdf}[/white]\n")
                     except Exception as e:
                         console.print(f"[red bold][ERRORE][/red bold] Compilazione PDF: {e}\n")
 
         # Riepilogo
-        from rich.align import Align
         summary = Table(show_header=False, box=box.SIMPLE, border_style="green", padding=(0, 2))
         summary.add_column(style="green bold", width=15)
         summary.add_column(style="white", width=50)